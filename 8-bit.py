@@ -3,6 +3,16 @@
 # The 8-puzzle is a classic sliding puzzle consisting of 8 numbered tiles and one empty space
 # arranged in a 3x3 grid. The goal is to move the tiles around until they are in the correct order.
 
+from eight_puzzle.board import MOVE_CODES, NO_MOVE, move_table
+
+# Shared move table: MOVE_TABLE[blank * 4 + direction] is where the blank lands, or NO_MOVE.
+MOVE_TABLE = move_table(3)
+
+# Solver move strings (U/D/L/R, direction the blank travels) mapped to game keys.
+SOLVER_MOVE_KEYS = {"U": "W", "D": "S", "L": "A", "R": "D"}
+# Game keys mapped to their direction index in the move table.
+KEY_DIRECTIONS = {key: MOVE_CODES.index(move) for move, key in SOLVER_MOVE_KEYS.items()}
+
 def instructions():
     
     # Show game instructions and controls.
@@ -42,11 +52,20 @@ def find_blank(board_state):
     return None  # Should not occur if input is valid
 
 
-def is_valid_position(row_index, col_index):
+def move_target(board_state, move_direction):
 
-    # Check if the given (row, col) position is within the 3x3 grid.
-    
-    return 0 <= row_index < 3 and 0 <= col_index < 3
+    # Look up where the blank lands for this move in the shared move table.
+    # Returns ((empty_row, empty_col), (new_row, new_col)), or None if the move is invalid.
+
+    empty_position = find_blank(board_state)
+    if empty_position is None or move_direction not in KEY_DIRECTIONS:
+        return None
+
+    empty_row, empty_col = empty_position
+    target = MOVE_TABLE[(empty_row * 3 + empty_col) * 4 + KEY_DIRECTIONS[move_direction]]
+    if target == NO_MOVE:
+        return None
+    return empty_position, divmod(target, 3)
 
 
 def is_valid_action(board_state, move_direction):
@@ -54,16 +73,7 @@ def is_valid_action(board_state, move_direction):
     # Check if the chosen move is valid based on the current blank position.
     # Move directions: W=Up, S=Down, A=Left, D=Right
     
-    empty_position = find_blank(board_state)
-    if empty_position is None:
-        return False
-
-    row_index, col_index = empty_position
-    if move_direction == "W": return is_valid_position(row_index - 1, col_index)
-    if move_direction == "S": return is_valid_position(row_index + 1, col_index)
-    if move_direction == "A": return is_valid_position(row_index, col_index - 1)
-    if move_direction == "D": return is_valid_position(row_index, col_index + 1)
-    return False
+    return move_target(board_state, move_direction) is not None
 
 
 def make_move(board_state, move_direction):
@@ -71,17 +81,12 @@ def make_move(board_state, move_direction):
     # Attempt to move the blank space in the given direction.
     # If valid, swap the blank with the neighboring tile.
     
-    if not is_valid_action(board_state, move_direction):
+    positions = move_target(board_state, move_direction)
+    if positions is None:
         return board_state, False  # Invalid move, state unchanged
 
-    # Locate current blank position
-    empty_row, empty_col = find_blank(board_state)
-
-    # Compute the new blank position based on direction
-    if move_direction == "W": new_row, new_col = empty_row - 1, empty_col
-    if move_direction == "S": new_row, new_col = empty_row + 1, empty_col
-    if move_direction == "A": new_row, new_col = empty_row, empty_col - 1
-    if move_direction == "D": new_row, new_col = empty_row, empty_col + 1
+    # Current and new blank positions, straight from the move table
+    (empty_row, empty_col), (new_row, new_col) = positions
 
     # Swap the tiles (blank ↔ neighboring tile)
     board_state[empty_row][empty_col], board_state[new_row][new_col] = (
@@ -92,6 +97,39 @@ def make_move(board_state, move_direction):
     return board_state, True
 
 
+def replay_moves(board_state, moves):
+
+    # Apply a whole solver move string (U/D/L/R, the direction the blank travels) to the board in place.
+    # Only solver letters are accepted: "D" would be ambiguous between solver Down and the Right key.
+    # The blank is located once and then tracked, so long strings replay without rescanning the grid.
+    # Returns (board_state, number of moves applied); stops at the first invalid move.
+
+    empty_position = find_blank(board_state)
+    if empty_position is None:
+        return board_state, 0
+
+    blank = empty_position[0] * 3 + empty_position[1]
+    for move_index, move_direction in enumerate(moves):
+        direction = MOVE_CODES.find(move_direction)
+        target = NO_MOVE if direction < 0 else MOVE_TABLE[blank * 4 + direction]
+        if target == NO_MOVE:
+            return board_state, move_index
+        board_state[blank // 3][blank % 3], board_state[target // 3][target % 3] = board_state[target // 3][target % 3], " "
+        blank = target
+
+    return board_state, len(moves)
+
+
+def verify_solution(initial_state, goal_state, moves):
+
+    # Check that a solver's move string turns initial_state into goal_state.
+    # Works on a copy, so the caller's board is left untouched.
+
+    board_state = [list(row) for row in initial_state]
+    board_state, applied_moves = replay_moves(board_state, moves)
+    return applied_moves == len(moves) and board_state == goal_state
+
+
 def parse_input(user_input):
     
     # Convert the user's comma-separated input string into a 3x3 board state.
@@ -0,0 +1,16 @@
+# Importable 8-puzzle solvers.
+# solve(initial, goal, algorithm=...) is the main entry point. Importing the package only loads the
+# small pure-Python modules; heavy precomputed tables are memory-mapped the first time they are used.
+
+from .board import (
+    DEFAULT_GOAL,
+    is_solvable,
+    pack_moves,
+    rank_state,
+    replay_moves,
+    serialize,
+    unpack_moves,
+    unrank_state,
+)
+from .budget import BudgetExceeded
+from .solver import ALGORITHMS, solve
@@ -0,0 +1,134 @@
+# A* search for the 8-puzzle with the Manhattan distance heuristic.
+
+import heapq # For implementing priority queue without manual sorting
+import time
+
+from .board import blank_position, move_targets
+from .budget import BudgetExceeded, check_budget
+from .tables import manhattan_table
+
+class Node:
+    def __init__(self, state, parent=None, g_cost=0, h_cost=0, move=None, blank=None):
+        self.state = state
+        self.parent = parent
+        self.move = move  # Move (U/D/L/R) that produced this state from its parent
+        self.blank = blank_position(state) if blank is None else blank  # Flat blank position (row * 3 + col)
+        self.g_cost = g_cost  # Cost from start to current node
+        self.h_cost = h_cost  # Heuristic cost from current node to goal
+        self.f_cost = g_cost + h_cost  # Total cost
+
+    def __lt__(self, other):
+        return self.f_cost < other.f_cost
+
+def a_star_search(initial_state, goal_state, get_neighbors_func, heuristic_func, return_moves=False,
+                  max_nodes=None, deadline=None, cancel_token=None):
+    """
+    Performs the A* search to find the shortest path from an initial state
+    to a goal state.
+
+    get_neighbors_func(state, blank) yields (state, cost, move, new_blank) tuples,
+    where blank is the blank's flat position (row * 3 + col) carried on each
+    node, so expansion never scans for it. With return_moves=True
+    the solution is returned as a move string instead of a list of states.
+
+    max_nodes caps the number of expansions, deadline is a time.monotonic()
+    timestamp and cancel_token is anything with is_set() (e.g. threading.Event).
+    If any of them trips, a BudgetExceeded is returned (its depth is the g_cost
+    of the last node expanded).
+    """
+    start_time = time.monotonic()
+    open_list = [] # priority queue for nodes to explore
+    closed_list = set() # explored nodes
+    nodes_expanded = 0
+    depth = 0
+
+    initial_h_cost = heuristic_func(initial_state, goal_state)
+    start_node = Node(state=initial_state, g_cost=0, h_cost=initial_h_cost) # starting node
+    heapq.heappush(open_list, start_node) # add start node to open list
+
+    while open_list:
+        current_node = heapq.heappop(open_list) # get node with lowest f_cost
+
+        # If the node has already been explored, skip it
+        if current_node.state in closed_list:
+            continue
+
+        # Stop early if a budget has run out (time and cancellation are polled periodically)
+        stop_reason = check_budget(nodes_expanded, max_nodes, deadline, cancel_token)
+        if stop_reason:
+            return BudgetExceeded(stop_reason, nodes_expanded, time.monotonic() - start_time, depth, len(open_list) + 1)
+
+        closed_list.add(current_node.state)
+        nodes_expanded += 1
+        depth = current_node.g_cost
+
+        # Check if we reached the goal
+        if current_node.state == goal_state:
+            path = []
+            temp = current_node
+            while temp:
+                path.append(temp.move if return_moves else temp.state)
+                temp = temp.parent
+            if return_moves:
+                return "".join(reversed(path[:-1])) # the start node has no move
+            return path[::-1]
+
+        # Explore neighbors
+        for neighbor_state, move_cost, move, neighbor_blank in get_neighbors_func(current_node.state, current_node.blank):
+            if neighbor_state in closed_list:
+                continue
+
+            g_cost = current_node.g_cost + move_cost # cost from start to neighbor
+            h_cost = heuristic_func(neighbor_state, goal_state) # heuristic cost from neighbor to goal
+
+            neighbor_node = Node(state=neighbor_state, parent=current_node, g_cost=g_cost, h_cost=h_cost, move=move,
+                                 blank=neighbor_blank) # create neighbor node
+            heapq.heappush(open_list, neighbor_node) # add neighbor to open list
+
+    return None # return None if no path is found
+
+
+# --------------------------------------------------------------------------
+# Helper functions for the 8-Puzzle Game
+# --------------------------------------------------------------------------
+
+def parse_puzzle_file(filename):
+    """Reads the puzzle.txt file and returns the initial and goal states."""
+    with open(filename, 'r') as f:
+        lines = [line.strip() for line in f.readlines()]
+
+    initial_idx = lines.index('initial:') + 1
+    goal_idx = lines.index('goal:') + 1
+
+    initial_state = tuple(tuple(map(int, row.split(','))) for row in lines[initial_idx:initial_idx+3])
+    goal_state = tuple(tuple(map(int, row.split(','))) for row in lines[goal_idx:goal_idx+3])
+
+    return initial_state, goal_state
+
+def calculate_manhattan_distance(state, goal_state):
+    """Heuristic function: Calculates the Manhattan distance for the 8-puzzle."""
+    h_cost = 0
+    distances = manhattan_table(goal_state) # built once per goal, then cached
+
+    for r in range(3):
+        for c in range(3):
+            h_cost += distances[state[r][c]][r * 3 + c]
+    return h_cost
+
+def get_neighbors(state, blank):
+    """Generates all valid (state, cost, move, new_blank) tuples by moving the blank tile (0) at position blank."""
+    neighbors = []
+    r, c = divmod(blank, 3)
+
+    # The shared move table lists only the moves that stay on the board
+    for move, target, nr, nc in move_targets(3)[blank]:
+        # Create a mutable copy (list of lists)
+        new_state_list = [list(row) for row in state]
+        # Swap the tiles
+        new_state_list[r][c], new_state_list[nr][nc] = new_state_list[nr][nc], new_state_list[r][c]
+        # Convert back to immutable tuple of tuples to be hashable
+        new_state_tuple = tuple(tuple(row) for row in new_state_list)
+        # Each move has a cost of 1
+        neighbors.append((new_state_tuple, 1, move, target))
+
+    return neighbors
@@ -0,0 +1,106 @@
+# Breadth-first search (BFS) for the 8-puzzle.
+# BFS explores states level by level to guarantee the shortest solution if one exists.
+
+import time
+from collections import deque
+
+from .board import blank_position, expand, print_board, serialize
+from .budget import BudgetExceeded, check_budget
+
+
+class Node:
+    def __init__(self, state, parent=None, move=None, blank=None):
+        
+        # Node represents a puzzle state and keeps track of its parent to reconstruct the path once the goal is found.
+        # move is the letter (U/D/L/R) that produced this state from its parent.
+        # blank is the blank's flat position (row * 3 + col), carried along so expansion never scans for it.
+        
+        self.state = state
+        self.parent = parent
+        self.move = move
+        self.blank = blank_position(state) if blank is None else blank
+
+    def path(self):
+        
+        # Reconstruct the path from the root node to this node.
+        
+        node, path_list = self, []
+        while node:
+            path_list.append(node)
+            node = node.parent
+        return path_list[::-1]  # reverse so root -> goal,  Returns the path as a list of nodes (from start to goal).
+
+    def moves(self):
+
+        # Reconstruct the solution as a move string (e.g. "ULDR") without keeping any boards.
+
+        node, move_list = self, []
+        while node.parent:
+            move_list.append(node.move)
+            node = node.parent
+        return "".join(reversed(move_list))
+
+
+def bfs(initial_state, goal_state, state_space=None, max_nodes=None, deadline=None, cancel_token=None, trace=None,
+        verbose=False):
+    
+    # Perform Breadth-First Search (BFS) from the initial state to the goal state.
+    # Tracks visited states and, if a dict is passed, state transitions in state_space.
+    # verbose=True prints every level and expanded board (the CLI walk-through); library calls stay quiet.
+    # Optional limits: max_nodes (expansions), deadline (time.monotonic() timestamp) and
+    # cancel_token (e.g. threading.Event). When one trips, returns (BudgetExceeded, level).
+    # trace, if given (e.g. eight_puzzle.trace.TraceRecorder), gets record(level, state, parent_state) per expansion.
+    
+    start_time = time.monotonic()
+    root = Node(initial_state)
+    if root.state == goal_state:
+        if verbose:
+            print("GOAL FOUND at Level 0")
+        return root, 0
+
+    frontier = deque([root])  # queue for BFS
+    explored = set()          # visited states
+    level = 0                 # BFS depth level
+    nodes_expanded = 0
+
+    while frontier:
+        level_size = len(frontier)
+        if verbose:
+            print(f"\n--- BFS Level {level} ---")
+
+        for _ in range(level_size):
+            stop_reason = check_budget(nodes_expanded, max_nodes, deadline, cancel_token)
+            if stop_reason:
+                stats = BudgetExceeded(stop_reason, nodes_expanded, time.monotonic() - start_time, level, len(frontier))
+                return stats, level
+
+            node = frontier.popleft()
+            nodes_expanded += 1
+            if trace is not None:
+                trace.record(level, node.state, node.parent.state if node.parent else None)
+            explored.add(serialize(node.state))
+
+            if verbose:
+                print_board(node.state)  # Display current node’s board
+
+            # Generate neighbors and record transitions
+            neighbors = expand(node.state, node.blank)
+            if state_space is not None:
+                state_space[serialize(node.state)] = [serialize(neighbor) for _, neighbor, _ in neighbors]
+
+            for move, neighbor, neighbor_blank in neighbors:
+                if serialize(neighbor) in explored:
+                    continue
+                child = Node(neighbor, node, move, neighbor_blank)
+
+                # Goal check
+                if neighbor == goal_state:
+                    if verbose:
+                        print("\nGOAL FOUND at Level", level + 1)
+                    return child, level + 1
+
+                frontier.append(child)
+
+        level += 1
+
+    return None, None # Returns the goal node and BFS level if found, (BudgetExceeded, level) if stopped early, else (None, None).
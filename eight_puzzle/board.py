@@ -0,0 +1,205 @@
+# Board representation and helpers shared by every solver.
+# A board is a 3x3 list of lists of ints with 0 as the blank.
+# Moves are named after the direction the blank travels; each fits in 2 bits,
+# so a solution packs 4 moves per byte.
+# Positions on the board are numbered row * size + col.
+
+import functools
+
+MOVE_CODES = "UDLR"
+MOVE_OFFSETS = {"U": (-1, 0), "D": (1, 0), "L": (0, -1), "R": (0, 1)}
+DEFAULT_GOAL = [[1, 2, 3], [4, 5, 6], [7, 8, 0]]
+NO_MOVE = 0xFF  # move table entry for a move that would leave the board
+
+
+@functools.lru_cache(maxsize=None)
+def move_table(size=3):
+
+    # Dense uint8 adjacency table for a size x size board, shared by every solver and the game.
+    # Entry [blank * 4 + direction] is the position the blank moves to for MOVE_CODES[direction],
+    # or NO_MOVE if that move would leave the board. Being plain bytes, it can also be handed to
+    # array-based code as is (e.g. numpy.frombuffer(move_table(), dtype=numpy.uint8).reshape(-1, 4)).
+
+    table = bytearray([NO_MOVE]) * (size * size * 4)
+    for blank in range(size * size):
+        row, col = divmod(blank, size)
+        for direction, move in enumerate(MOVE_CODES):
+            row_offset, col_offset = MOVE_OFFSETS[move]
+            new_row, new_col = row + row_offset, col + col_offset
+            if 0 <= new_row < size and 0 <= new_col < size:
+                table[blank * 4 + direction] = new_row * size + new_col
+    return bytes(table)
+
+
+@functools.lru_cache(maxsize=None)
+def move_targets(size=3):
+
+    # The valid entries of move_table(size) unpacked for Python loops: move_targets(size)[blank] is a tuple of
+    # (move, target, target_row, target_col) in MOVE_CODES order, so expansion needs no bounds checks.
+
+    table = move_table(size)
+    return tuple(
+        tuple((move, table[blank * 4 + direction]) + divmod(table[blank * 4 + direction], size)
+              for direction, move in enumerate(MOVE_CODES) if table[blank * 4 + direction] != NO_MOVE)
+        for blank in range(size * size)
+    )
+
+
+def print_board(state):
+    
+    # print a board state in a 3x3 format.
+    
+    for row in state:
+        print(" ".join(str(tile) for tile in row))
+    print()
+
+
+def find_empty(state):
+    
+    # Find the (row, col) position of the blank (represented by 0).
+    
+    for row_index in range(3):
+        for col_index in range(3):
+            if state[row_index][col_index] == 0:
+                return row_index, col_index
+    return None
+
+
+def blank_position(state):
+
+    # Flat position (row * 3 + col) of the blank, the form the move table is indexed by.
+
+    empty_row, empty_col = find_empty(state)
+    return empty_row * 3 + empty_col
+
+
+def expand(state, blank):
+
+    # Hot-path neighbor generation for a state whose blank position is already known.
+    # The move table lists only the valid moves, so there is no blank scan and no bounds check.
+
+    empty_row, empty_col = divmod(blank, 3)
+    neighbors = []
+
+    # Possible moves: up, down, left, right (whichever stay on the board)
+    for move, target, new_row, new_col in move_targets(3)[blank]:
+        new_state = [list(row) for row in state]  # deep copy
+        # Swap blank with the tile in the new position
+        new_state[empty_row][empty_col], new_state[new_row][new_col] = new_state[new_row][new_col], 0
+        neighbors.append((move, new_state, target))
+
+    return neighbors # Returns a list of (move, state, new blank position) triples.
+
+
+def replay_moves(state, moves):
+
+    # Lazily rebuild the boards along a move string, starting from state.
+    # Yields the start board first, then one board per move, so callers only pay for the boards they look at.
+
+    table = move_table(3)
+    board = [list(row) for row in state]
+    blank = blank_position(board)
+    yield [list(row) for row in board]
+    for move in moves:
+        target = table[blank * 4 + MOVE_CODES.index(move)]
+        if target == NO_MOVE:
+            raise ValueError(f"Move {move!r} leaves the board")
+        board[blank // 3][blank % 3], board[target // 3][target % 3] = board[target // 3][target % 3], 0
+        blank = target
+        yield [list(row) for row in board]
+
+
+def pack_moves(moves):
+
+    # Pack a move string into bytes, 2 bits per move (4 moves per byte, first move in the low bits).
+    # The move count is not stored; keep len(moves) alongside the packed bytes.
+
+    packed = bytearray((len(moves) + 3) // 4)
+    for index, move in enumerate(moves):
+        packed[index >> 2] |= MOVE_CODES.index(move) << ((index & 3) * 2)
+    return bytes(packed)
+
+
+def unpack_moves(packed, move_count):
+
+    # Inverse of pack_moves(): rebuild the move string from its packed bytes.
+
+    return "".join(MOVE_CODES[(packed[index >> 2] >> ((index & 3) * 2)) & 3] for index in range(move_count))
+
+
+def serialize(state):
+    
+    # Convert a 2D board state into a string for hashing/comparison.
+    # Example: [[1,2,3],[4,5,6],[7,8,0]] -> "123456780"
+    
+    return "".join(str(tile) for row in state for tile in row)
+
+
+def rank_state(state):
+
+    # Pack a board into its permutation rank (0 .. 9!-1), a compact integer key for indexes and logs.
+    # Example: [[0,1,2],[3,4,5],[6,7,8]] -> 0
+
+    tiles = [tile for row in state for tile in row]
+    rank = 0
+    for index, tile in enumerate(tiles):
+        smaller_after = sum(1 for later in tiles[index + 1:] if later < tile)
+        rank = rank * (len(tiles) - index) + smaller_after
+    return rank
+
+
+def unrank_state(rank, size=3):
+
+    # Inverse of rank_state(): rebuild the size x size board with the given permutation rank.
+
+    tile_count = size * size
+    digits = []
+    for base in range(1, tile_count + 1):
+        digits.append(rank % base)
+        rank //= base
+    remaining = list(range(tile_count))
+    tiles = [remaining.pop(digit) for digit in reversed(digits)]
+    return [tiles[row_start:row_start + size] for row_start in range(0, tile_count, size)]
+
+
+def validate_board(state):
+
+    # Raise ValueError unless state is a 3x3 board holding each of the tiles 0..8 exactly once.
+
+    tiles = [tile for row in state for tile in row]
+    if len(state) != 3 or any(len(row) != 3 for row in state) or set(tiles) != set(range(9)):
+        raise ValueError(f"Expected a 3x3 board holding the tiles 0-8 once each, got {state!r}")
+
+
+def is_solvable(state):
+    
+    # Check if the puzzle is solvable using the inversion count method.
+    # If the number of inversions is even -> solvable.
+    
+    flat_list = [num for row in state for num in row if num != 0]
+    inversions = 0
+    for i in range(len(flat_list)):
+        for j in range(i + 1, len(flat_list)):
+            if flat_list[i] > flat_list[j]:
+                inversions += 1
+    return inversions % 2 == 0
+
+
+def read_input_file(filename):
+    
+    # Read initial and goal states from a text file.
+    # File format: 6 lines -> first 3 lines = initial state, next 3 lines = goal state.
+    # Blank tile should be represented by 0 or space.
+    
+    with open(filename, "r") as file:
+        lines = [line.strip() for line in file if line.strip()]
+
+    if len(lines) != 6:
+        raise ValueError("File must contain exactly 6 lines (3 for initial, 3 for goal)")
+
+    def parse_board(board_lines):
+        return [[int(tile) if tile != " " else 0 for tile in line.split(",")] for line in board_lines]
+
+    initial_state = parse_board(lines[:3])
+    goal_state = parse_board(lines[3:])
+    return initial_state, goal_state
@@ -0,0 +1,41 @@
+# Search limits shared by the solvers: node budgets, deadlines and cancellation.
+
+import time
+
+# The deadline and cancellation token are polled once every CHECK_INTERVAL expansions
+# so the hot loop only pays for an integer comparison on most iterations.
+CHECK_INTERVAL = 256
+
+
+class BudgetExceeded:
+    def __init__(self, reason, nodes_expanded, elapsed, depth, frontier_size):
+
+        # Returned instead of a solution when a search stops early.
+        # reason is "nodes", "deadline" or "cancelled"; the rest are partial stats at the moment it stopped.
+        # Callers tell it apart from a real result with isinstance(result, BudgetExceeded); it is not falsy,
+        # so a timeout can never be mistaken for "no solution found".
+
+        self.reason = reason
+        self.nodes_expanded = nodes_expanded
+        self.elapsed = elapsed
+        self.depth = depth
+        self.frontier_size = frontier_size
+
+    def __repr__(self):
+        return (f"BudgetExceeded(reason={self.reason!r}, nodes_expanded={self.nodes_expanded}, "
+                f"elapsed={self.elapsed:.3f}, depth={self.depth}, frontier_size={self.frontier_size})")
+
+
+def check_budget(nodes_expanded, max_nodes, deadline, cancel_token):
+
+    # Return the reason a search has to stop, or None if it may continue.
+    # deadline is a time.monotonic() timestamp; cancel_token is anything with is_set(), e.g. threading.Event.
+
+    if max_nodes is not None and nodes_expanded >= max_nodes:
+        return "nodes"
+    if nodes_expanded % CHECK_INTERVAL == 0:
+        if cancel_token is not None and cancel_token.is_set():
+            return "cancelled"
+        if deadline is not None and time.monotonic() >= deadline:
+            return "deadline"
+    return None
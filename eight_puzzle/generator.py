@@ -0,0 +1,155 @@
+# Random 8-puzzle instance generator
+# Produces solvable puzzles either uniformly over all solvable states, or uniformly among the
+# states at an exact optimal distance from the goal. Distances come from the precomputed depth
+# index in tables.py, so no puzzle ever has to be run through a solver.
+# Output is streamed either as the usual 6-line text files or as a compact binary stream.
+
+import functools
+import os
+import random
+import struct
+from array import array
+
+from .board import DEFAULT_GOAL, is_solvable, rank_state, serialize, unrank_state
+from .tables import UNREACHABLE, depth_index
+
+# Binary stream: magic, the 9 goal tiles, then one record per puzzle (uint32 rank, uint8 depth).
+BINARY_MAGIC = b"8PZ1"
+RECORD = struct.Struct("<IB")
+
+
+def ranks_by_depth(index):
+
+    # Group state ranks into one array per optimal depth, so sampling at a depth is a single random pick.
+
+    buckets = []
+    for rank, depth in enumerate(bytes(index)):
+        if depth == UNREACHABLE:
+            continue
+        while len(buckets) <= depth:
+            buckets.append(array("I"))
+        buckets[depth].append(rank)
+    return buckets
+
+
+def reachable_ranks(buckets):
+
+    # All ranks from ranks_by_depth() in one array, so a uniform solvable state is a single random pick.
+
+    ranks = array("I")
+    for bucket in buckets:
+        ranks.extend(bucket)
+    return ranks
+
+
+@functools.lru_cache(maxsize=None)
+def _goal_ranks(goal_key):
+    # (buckets by depth, all reachable ranks) for a goal's own depth index, built once per process
+    goal_tiles = [int(tile) for tile in goal_key]
+    buckets = ranks_by_depth(depth_index([goal_tiles[row_start:row_start + 3] for row_start in range(0, 9, 3)]))
+    return buckets, reachable_ranks(buckets)
+
+
+def random_solvable_state(goal_state, rng=random, goal_parity=None):
+
+    # Draw a uniformly random state that can reach goal_state.
+    # A random permutation of the wrong parity is fixed by swapping its first two tiles; that swap
+    # pairs every unsolvable permutation with exactly one solvable one, so the result stays uniform.
+    # goal_parity is is_solvable(goal_state); pass it in when drawing many states for the same goal.
+
+    if goal_parity is None:
+        goal_parity = is_solvable(goal_state)
+    tiles = [tile for row in goal_state for tile in row]
+    rng.shuffle(tiles)
+    state = [tiles[row_start:row_start + 3] for row_start in range(0, 9, 3)]
+    if is_solvable(state) != goal_parity:
+        first, second = [position for position, tile in enumerate(tiles) if tile != 0][:2]
+        tiles[first], tiles[second] = tiles[second], tiles[first]
+        state = [tiles[row_start:row_start + 3] for row_start in range(0, 9, 3)]
+    return state
+
+
+def generate(count, goal_state=DEFAULT_GOAL, depth=None, index=None, rng=random):
+
+    # Yield count (initial_state, goal_state, optimal_depth) puzzles.
+    # With depth=None states are uniform over all solvable states; otherwise uniform among states exactly depth moves away.
+    # Either way each puzzle is one random rank pick, so no state is ranked or parity-checked per sample.
+
+    # The rank arrays of a goal's own index are built once and reused by later calls
+    if index is None:
+        index = depth_index(goal_state)
+        buckets, reachable = _goal_ranks(serialize(goal_state))
+    else:
+        buckets = ranks_by_depth(index)
+        reachable = reachable_ranks(buckets) if depth is None else None
+
+    if depth is None:
+        for _ in range(count):
+            rank = reachable[rng.randrange(len(reachable))]
+            yield unrank_state(rank), goal_state, index[rank]
+        return
+
+    if not 0 <= depth < len(buckets):
+        raise ValueError(f"No states at depth {depth}; the deepest state is {len(buckets) - 1} moves away")
+    bucket = buckets[depth]
+    for _ in range(count):
+        yield unrank_state(bucket[rng.randrange(len(bucket))]), goal_state, depth
+
+
+def format_board(state):
+
+    # Render a board as the comma-separated rows used by the sample_*.txt files.
+
+    return "\n".join(",".join(str(tile) for tile in row) for row in state)
+
+
+def write_text(puzzles, directory):
+
+    # Stream puzzles into directory as puzzle_000000.txt, ... in the 6-line format read_input_file() expects.
+    # Returns the number of files written.
+
+    os.makedirs(directory, exist_ok=True)
+    written = 0
+    for initial_state, goal_state, _ in puzzles:
+        with open(os.path.join(directory, f"puzzle_{written:06d}.txt"), "w") as file:
+            file.write(format_board(initial_state) + "\n\n\n" + format_board(goal_state) + "\n")
+        written += 1
+    return written
+
+
+def write_binary(puzzles, stream):
+
+    # Stream puzzles as 5-byte records after a header holding the goal; all puzzles must share one goal.
+    # Returns the number of records written.
+
+    written = 0
+    goal_tiles = None
+    for initial_state, goal_state, depth in puzzles:
+        tiles = bytes(tile for row in goal_state for tile in row)
+        if goal_tiles is None:
+            goal_tiles = tiles
+            stream.write(BINARY_MAGIC + goal_tiles)
+        elif tiles != goal_tiles:
+            raise ValueError("All puzzles in a binary stream must share the same goal")
+        stream.write(RECORD.pack(rank_state(initial_state), depth))
+        written += 1
+    return written
+
+
+def read_binary(stream):
+
+    # Yield (initial_state, goal_state, optimal_depth) puzzles back from a write_binary() stream.
+
+    header = stream.read(len(BINARY_MAGIC) + 9)
+    if not header:
+        return
+    if header[:len(BINARY_MAGIC)] != BINARY_MAGIC:
+        raise ValueError("Not an 8-puzzle binary stream")
+    goal_tiles = list(header[len(BINARY_MAGIC):])
+    goal_state = [goal_tiles[row_start:row_start + 3] for row_start in range(0, 9, 3)]
+    while True:
+        record = stream.read(RECORD.size)
+        if len(record) < RECORD.size:
+            return
+        rank, depth = RECORD.unpack(record)
+        yield unrank_state(rank), goal_state, depth
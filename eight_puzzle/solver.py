@@ -0,0 +1,61 @@
+# Single entry point for solving a puzzle with any of the solvers.
+
+from .board import DEFAULT_GOAL, blank_position, expand, is_solvable, rank_state, validate_board
+from .budget import BudgetExceeded
+
+ALGORITHMS = ("astar", "bfs", "table")
+
+
+def solve(initial, goal=DEFAULT_GOAL, algorithm="astar", max_nodes=None, deadline=None, cancel_token=None):
+
+    # Solve the puzzle and return the solution as a move string (U/D/L/R, the direction the blank travels).
+    # "" is a valid solution (initial already equals goal), so compare the result with None rather than testing truth.
+    # Raises ValueError for an unknown algorithm or a board that is not 3x3 with the tiles 0-8 once each.
+    # Returns None if goal cannot be reached from initial, or a BudgetExceeded if a limit tripped first;
+    # check for the latter with isinstance(result, BudgetExceeded).
+    #   "astar" - A* with the Manhattan distance heuristic
+    #   "bfs"   - breadth-first search
+    #   "table" - walks the precomputed depth index downhill; loads (or builds) the table on first use
+    # max_nodes, deadline (time.monotonic() timestamp) and cancel_token (e.g. threading.Event) bound the
+    # searches. For "table", building a goal's depth index the first time costs a couple of seconds and
+    # honours deadline and cancel_token (not max_nodes); the walk itself takes at most 31 steps.
+
+    # Checked first so a misspelt algorithm is never reported as an unsolvable puzzle
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown algorithm {algorithm!r}; expected one of {', '.join(ALGORITHMS)}")
+
+    # Reject anything that is not an 8-puzzle board before any solver or table sees it
+    initial = [list(row) for row in initial]
+    goal = [list(row) for row in goal]
+    validate_board(initial)
+    validate_board(goal)
+    if is_solvable(initial) != is_solvable(goal):
+        return None
+
+    if algorithm == "astar":
+        from .astar import a_star_search, calculate_manhattan_distance, get_neighbors
+        return a_star_search(tuple(map(tuple, initial)), tuple(map(tuple, goal)), get_neighbors,
+                             calculate_manhattan_distance, return_moves=True,
+                             max_nodes=max_nodes, deadline=deadline, cancel_token=cancel_token)
+
+    if algorithm == "bfs":
+        from .bfs import bfs
+        solution_node, _ = bfs(initial, goal, max_nodes=max_nodes, deadline=deadline, cancel_token=cancel_token)
+        if solution_node is None or isinstance(solution_node, BudgetExceeded):
+            return solution_node
+        return solution_node.moves()
+
+    if algorithm == "table":
+        from .tables import depth_index
+        index = depth_index(goal, deadline, cancel_token)
+        if isinstance(index, BudgetExceeded):
+            return index
+        state, blank, moves = initial, blank_position(initial), []
+        depth = index[rank_state(state)]
+        while depth:
+            # Some neighbor is always exactly one move closer to the goal
+            move, state, blank = next(neighbor for neighbor in expand(state, blank)
+                                      if index[rank_state(neighbor[1])] == depth - 1)
+            moves.append(move)
+            depth -= 1
+        return "".join(moves)
@@ -0,0 +1,127 @@
+# Precomputed tables, loaded lazily on first use.
+# The depth index (optimal distance of every state to a goal, one byte per permutation rank) is
+# built once per goal, saved to the cache directory and memory-mapped afterwards, so a fresh
+# process pays only for an mmap instead of a full breadth-first sweep.
+# The cache directory is $EIGHT_PUZZLE_CACHE, or ~/.cache/eight_puzzle if that is not set.
+
+import functools
+import mmap
+import os
+import tempfile
+import time
+from collections import deque
+
+from .board import move_targets, rank_state, serialize
+from .budget import BudgetExceeded, check_budget
+
+STATE_COUNT = 362880  # 9! permutation ranks
+UNREACHABLE = 0xFF    # depth index marker for states of the wrong parity
+
+_depth_indexes = {}   # goal key -> memory-mapped depth index, filled on first use
+
+# The process umask, read once at import (os.umask can only be read by setting it). Saved tables get
+# the usual 0644-under-umask mode rather than mkstemp's 0600, so workers under other accounts can share them.
+_UMASK = os.umask(0o022)
+os.umask(_UMASK)
+
+
+def cache_dir():
+
+    # Directory holding the saved tables, created on demand.
+
+    directory = os.environ.get("EIGHT_PUZZLE_CACHE") or os.path.join(os.path.expanduser("~"), ".cache", "eight_puzzle")
+    os.makedirs(directory, exist_ok=True)
+    return directory
+
+
+def build_depth_index(goal_state, deadline=None, cancel_token=None):
+
+    # Breadth-first sweep outward from the goal over all reachable states.
+    # Returns a bytearray indexed by rank_state() holding each state's optimal distance to the goal,
+    # or a BudgetExceeded if deadline (time.monotonic() timestamp) or cancel_token trips first.
+
+    start_time = time.monotonic()
+    nodes_expanded = 0
+    goal_tiles = tuple(tile for row in goal_state for tile in row)
+    swaps = [[target for _, target, _, _ in targets] for targets in move_targets(3)]
+
+    depths = {goal_tiles: 0}
+    frontier = deque([goal_tiles])
+    while frontier:
+        stop_reason = check_budget(nodes_expanded, None, deadline, cancel_token)
+        if stop_reason:
+            return BudgetExceeded(stop_reason, nodes_expanded, time.monotonic() - start_time,
+                                  depths[frontier[0]], len(frontier))
+
+        tiles = frontier.popleft()
+        nodes_expanded += 1
+        next_depth = depths[tiles] + 1
+        blank = tiles.index(0)
+        for target in swaps[blank]:
+            neighbor = list(tiles)
+            neighbor[blank], neighbor[target] = neighbor[target], 0
+            neighbor = tuple(neighbor)
+            if neighbor not in depths:
+                depths[neighbor] = next_depth
+                frontier.append(neighbor)
+
+    index = bytearray([UNREACHABLE]) * STATE_COUNT
+    for tiles, depth in depths.items():
+        index[rank_state([tiles])] = depth  # a single 9-tile row ranks the same as the 3x3 board
+    return index
+
+
+def depth_index(goal_state, deadline=None, cancel_token=None):
+
+    # Read-only, memory-mapped depth index for goal_state: depth_index(goal)[rank_state(state)] is the
+    # optimal number of moves from state to goal (UNREACHABLE for the other parity class).
+    # The first use of a goal without a saved table builds it, which takes a couple of seconds;
+    # if deadline or cancel_token trips during that build, a BudgetExceeded is returned and nothing is cached.
+
+    goal_key = serialize(goal_state)
+    index = _depth_indexes.get(goal_key)
+    if index is None:
+        index = _load_depth_index(goal_key, deadline, cancel_token)
+        if isinstance(index, BudgetExceeded):
+            return index
+        index = _depth_indexes.setdefault(goal_key, index)
+    return index
+
+
+def _load_depth_index(goal_key, deadline, cancel_token):
+    path = os.path.join(cache_dir(), f"depth_index_{goal_key}.bin")
+    if not os.path.exists(path) or os.path.getsize(path) != STATE_COUNT:
+        goal_tiles = [int(tile) for tile in goal_key]
+        index = build_depth_index([goal_tiles[row_start:row_start + 3] for row_start in range(0, 9, 3)],
+                                  deadline, cancel_token)
+        if isinstance(index, BudgetExceeded):
+            return index
+        # Write to a uniquely named file first so concurrent processes or threads never map a half-written table
+        temp_fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=os.path.basename(path), suffix=".tmp")
+        os.fchmod(temp_fd, 0o644 & ~_UMASK)
+        with os.fdopen(temp_fd, "wb") as file:
+            file.write(index)
+        os.replace(temp_path, path)
+
+    with open(path, "rb") as file:
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def manhattan_table(goal_state):
+
+    # Per-goal Manhattan distance table: manhattan_table(goal)[tile][row * 3 + col] is how far tile
+    # sits from its goal square when placed at (row, col). The blank's row is all zeros.
+
+    return _manhattan_table(tuple(tuple(row) for row in goal_state))
+
+
+@functools.lru_cache(maxsize=None)
+def _manhattan_table(goal_state):
+    goal_positions = {tile: (r, c) for r, row in enumerate(goal_state) for c, tile in enumerate(row)}
+    table = [[0] * 9 for _ in range(9)]
+    for tile, (goal_r, goal_c) in goal_positions.items():
+        if tile == 0:
+            continue
+        for position in range(9):
+            table[tile][position] = abs(position // 3 - goal_r) + abs(position % 3 - goal_c)
+    return table
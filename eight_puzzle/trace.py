@@ -0,0 +1,79 @@
+# Search-trace recording
+# TraceRecorder is passed to bfs() as trace=... and appends every expanded node to a compact binary
+# log: a header (magic, initial rank, goal rank) followed by one 10-byte record per expansion
+# (uint16 level, uint32 state rank, uint32 parent rank). Records are flushed level by level, so an
+# interrupted search still leaves a readable prefix.
+
+import struct
+from itertools import groupby
+
+from .board import rank_state
+
+TRACE_MAGIC = b"8PT1"
+HEADER = struct.Struct("<II")
+RECORD = struct.Struct("<HII")
+NO_PARENT = 0xFFFFFFFF  # parent rank stored for the root node
+
+
+class TraceRecorder:
+    def __init__(self, filename, initial_state, goal_state):
+
+        # Open a new trace log for a search from initial_state to goal_state.
+        # Use as a context manager (or call close()) so the last level is written out.
+
+        self.file = open(filename, "wb")
+        self.file.write(TRACE_MAGIC + HEADER.pack(rank_state(initial_state), rank_state(goal_state)))
+        self.buffer = bytearray()
+        self.level = 0
+
+    def record(self, level, state, parent_state):
+
+        # Append one expanded node. Called by bfs() for every node it pops off the frontier.
+
+        if level != self.level:
+            self.flush()
+            self.level = level
+        parent_rank = NO_PARENT if parent_state is None else rank_state(parent_state)
+        self.buffer += RECORD.pack(level, rank_state(state), parent_rank)
+
+    def flush(self):
+
+        # Write out the buffered records of the current level.
+
+        self.file.write(self.buffer)
+        self.file.flush()
+        self.buffer.clear()
+
+    def close(self):
+        self.flush()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def read_trace(filename):
+
+    # Read a trace log. Returns (initial_rank, goal_rank, records) where records is a list of
+    # (level, state_rank, parent_rank) tuples in expansion order. A truncated last record is ignored.
+
+    with open(filename, "rb") as file:
+        data = file.read()
+    if data[:len(TRACE_MAGIC)] != TRACE_MAGIC:
+        raise ValueError(f"{filename} is not a search trace")
+    initial_rank, goal_rank = HEADER.unpack_from(data, len(TRACE_MAGIC))
+    body_start = len(TRACE_MAGIC) + HEADER.size
+    body_end = body_start + (len(data) - body_start) // RECORD.size * RECORD.size
+    records = list(RECORD.iter_unpack(data[body_start:body_end]))
+    return initial_rank, goal_rank, records
+
+
+def trace_levels(records):
+
+    # Group trace records by level: {level: [(state_rank, parent_rank), ...]}.
+
+    return {level: [(state_rank, parent_rank) for _, state_rank, parent_rank in group]
+            for level, group in groupby(records, key=lambda record: record[0])}
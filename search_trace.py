@@ -0,0 +1,92 @@
+# Search-trace replay tool
+# Steps through, filters, or diffs traces recorded by eight_puzzle.trace.TraceRecorder
+# (e.g. from the BFS command line) without re-running the search.
+
+import argparse
+
+from eight_puzzle.board import print_board, unrank_state
+from eight_puzzle.trace import NO_PARENT, read_trace, trace_levels
+
+
+def show_trace(filename, level=None, state=None, boards=False, step=False):
+
+    # Print a trace level by level, optionally restricted to one level and/or one state rank.
+    # With step=True, waits for Enter between levels (type q to stop).
+
+    initial_rank, goal_rank, records = read_trace(filename)
+    print(f"Initial state rank {initial_rank}, goal state rank {goal_rank}, {len(records)} expansions")
+
+    for trace_level, nodes in trace_levels(records).items():
+        if level is not None and trace_level != level:
+            continue
+        if state is not None:
+            nodes = [node for node in nodes if node[0] == state]
+            if not nodes:
+                continue
+
+        print(f"\n--- BFS Level {trace_level}: {len(nodes)} expanded ---")
+        for state_rank, parent_rank in nodes:
+            parent_text = "root" if parent_rank == NO_PARENT else f"parent {parent_rank}"
+            print(f"state {state_rank} ({parent_text})")
+            if boards:
+                print_board(unrank_state(state_rank))
+
+        if step and input("Enter for next level, q to quit: ").strip().lower() == "q":
+            break
+
+
+def diff_traces(filename_a, filename_b):
+
+    # Compare two traces level by level: expansion counts and states expanded by only one of them.
+    # Returns the first level where the two traces differ, or None if they match.
+
+    levels_a = trace_levels(read_trace(filename_a)[2])
+    levels_b = trace_levels(read_trace(filename_b)[2])
+    first_difference = None
+
+    for level in sorted(set(levels_a) | set(levels_b)):
+        states_a = {state_rank for state_rank, _ in levels_a.get(level, [])}
+        states_b = {state_rank for state_rank, _ in levels_b.get(level, [])}
+        count_a, count_b = len(levels_a.get(level, [])), len(levels_b.get(level, []))
+        only_a, only_b = states_a - states_b, states_b - states_a
+
+        marker = "" if count_a == count_b and not only_a and not only_b else "  <-- differs"
+        print(f"Level {level}: {count_a} vs {count_b} expansions, "
+              f"{len(only_a)} only in A, {len(only_b)} only in B{marker}")
+        if marker and first_difference is None:
+            first_difference = level
+
+    if first_difference is None:
+        print("Traces match.")
+    else:
+        print(f"First difference at level {first_difference}")
+    return first_difference
+
+
+def main():
+    """
+    Command-line replay tool for bfs() search traces.
+    """
+    parser = argparse.ArgumentParser(description="Replay, filter and diff 8-puzzle search traces.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    show_parser = commands.add_parser("show", help="print a trace level by level")
+    show_parser.add_argument("trace")
+    show_parser.add_argument("--level", type=int, help="only show this level")
+    show_parser.add_argument("--state", type=int, help="only show this state rank")
+    show_parser.add_argument("--boards", action="store_true", help="print each expanded board")
+    show_parser.add_argument("--step", action="store_true", help="pause after each level")
+
+    diff_parser = commands.add_parser("diff", help="compare two traces level by level")
+    diff_parser.add_argument("trace_a")
+    diff_parser.add_argument("trace_b")
+
+    args = parser.parse_args()
+    if args.command == "show":
+        show_trace(args.trace, args.level, args.state, args.boards, args.step)
+    else:
+        diff_traces(args.trace_a, args.trace_b)
+
+
+if __name__ == "__main__":
+    main()